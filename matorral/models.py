@@ -53,26 +53,23 @@ class ModelWithProgress(models.Model):
         StoryState = apps.get_model("stories", "StoryState")
 
         parent_dict = {self._meta.model_name: self.id}
+        done = models.Q(state__stype=StoryState.STATE_DONE)
 
-        # calculate total points
-        total_points = Story.objects.filter(**parent_dict).aggregate(models.Sum("points"))["points__sum"] or 0
+        # calculate points and story counts, total and done, in a single query
+        totals = Story.objects.filter(**parent_dict).aggregate(
+            total_points=models.Sum("points"),
+            story_count=models.Count("id"),
+            points_done=models.Sum("points", filter=done),
+            stories_done=models.Count("id", filter=done),
+        )
 
-        if total_points == 0:
-            # if no story has points, then count the stories
-            total_points = Story.objects.filter(**parent_dict).count()
-
-        # calculate points done
-        params = parent_dict.copy()
-        params["state__stype"] = StoryState.STATE_DONE
-        points_done = Story.objects.filter(**params).aggregate(models.Sum("points"))["points__sum"] or 0
-
-        if points_done == 0:
-            # if no story has points, then count the stories
-            points_done = Story.objects.filter(**params).count()
+        # if no story has points, then count the stories
+        total_points = totals["total_points"] or totals["story_count"]
+        points_done = totals["points_done"] or totals["stories_done"]
 
         self.total_points = total_points
         self.points_done = points_done
-        self.story_count = Story.objects.filter(**parent_dict).count()
+        self.story_count = totals["story_count"]
 
         self.progress = int(float(points_done) / (total_points or 1) * 100)
 
@@ -22,24 +22,22 @@ class SprintDetailView(DetailView):
 
     model = Sprint
 
-    def get_children(self):
-        queryset = (
-            self.get_object()
-            .story_set.select_related("requester", "assignee", "epic", "state")
-            .order_by("epic__priority", "priority")
-        )
+    group_by_config = dict(
+        epic=("epic__title", lambda story: story.epic and story.epic.title or "No Epic"),
+        state=("state__slug", lambda story: story.state.name),
+        requester=("requester__username", lambda story: story.requester and story.requester.username or "Unset"),
+        assignee=("assignee__username", lambda story: story.assignee and story.assignee.username or "Unassigned"),
+    )
 
-        config = dict(
-            epic=("epic__title", lambda story: story.epic and story.epic.title or "No Epic"),
-            state=("state__slug", lambda story: story.state.name),
-            requester=("requester__username", lambda story: story.requester and story.requester.username or "Unset"),
-            assignee=("assignee__username", lambda story: story.assignee and story.assignee.username or "Unassigned"),
+    def get_children(self):
+        queryset = self.object.story_set.select_related("requester", "assignee", "epic", "state").order_by(
+            "epic__priority", "priority"
         )
 
         group_by = self.request.GET.get("group_by")
 
         try:
-            order_by, fx = config[group_by]
+            order_by, fx = self.group_by_config[group_by]
         except KeyError:
             return [(None, queryset)]
         else:
@@ -69,15 +67,11 @@ class SprintDetailView(DetailView):
 
         else:
             state = self.request.POST.get("state")
-            if isinstance(state, list):
-                state = state[0]
             if state:
                 story_ids = [t[6:] for t in self.request.POST.keys() if "story-" in t]
                 story_set_state.delay(story_ids, state)
 
             assignee = self.request.POST.get("assignee")
-            if isinstance(assignee, list):
-                assignee = assignee[0]
             if assignee:
                 story_ids = [t[6:] for t in self.request.POST.keys() if "story-" in t]
                 story_set_assignee.delay(story_ids, assignee)
@@ -22,7 +22,7 @@ class EpicFilterForm(Form):
     )
 
     owner = ModelChoiceField(
-        empty_label="--Set Owner--", queryset=User.objects.all(), required=False, widget=custom_select
+        empty_label="--Set Owner--", queryset=User.objects.for_choices(), required=False, widget=custom_select
     )
 
 
@@ -32,7 +32,7 @@ class StoryFilterForm(Form):
     )
 
     assignee = ModelChoiceField(
-        empty_label="--Set Assignee--", queryset=User.objects.all(), required=False, widget=custom_select
+        empty_label="--Set Assignee--", queryset=User.objects.for_choices(), required=False, widget=custom_select
     )
 
 
@@ -86,8 +86,8 @@ class EpicForm(BaseWorkspaceModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fields["owner"].queryset = User.objects.filter(is_active=True, workspace=self.workspace).order_by(
-            "username"
+        self.fields["owner"].queryset = (
+            User.objects.filter(is_active=True, workspace=self.workspace).for_choices().order_by("username")
         )
 
 
@@ -109,7 +109,8 @@ class StoryForm(BaseWorkspaceModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fields["requester"].queryset = self.workspace.members.filter(is_active=True).order_by("username")
-        self.fields["assignee"].queryset = self.workspace.members.filter(is_active=True).order_by("username")
+        members = self.workspace.members.filter(is_active=True).for_choices().order_by("username")
+        self.fields["requester"].queryset = members
+        self.fields["assignee"].queryset = members
         self.fields["epic"].queryset = Epic.objects.filter(workspace=self.workspace).order_by("title")
         self.fields["sprint"].queryset = Sprint.objects.filter(workspace=self.workspace).order_by("ends_at")
@@ -87,8 +87,10 @@ class Epic(ModelWithProgress):
             cloned.tags.add(tag)
 
     def update_state(self):
+        previous_state_id = self.state_id
+
         # set epic as started when it has one or more started stories
-        if Story.objects.filter(state__stype=StoryState.STATE_STARTED, epic=self).count() > 0:
+        if Story.objects.filter(state__stype=StoryState.STATE_STARTED, epic=self).exists():
             if self.state.stype != EpicState.STATE_STARTED:
                 self.state = EpicState.objects.filter(stype=EpicState.STATE_STARTED)[0]
 
@@ -96,7 +98,9 @@ class Epic(ModelWithProgress):
             if self.state.stype != EpicState.STATE_UNSTARTED:
                 self.state = EpicState.objects.filter(stype=EpicState.STATE_UNSTARTED)[0]
 
-        self.save()
+        # only write the state column, and only when it actually changed
+        if self.state_id != previous_state_id:
+            self.save(update_fields=["state"])
 
 
 class Story(BaseModel):
@@ -159,6 +163,12 @@ def handle_story_pre_save(sender, **kwargs):
     if not kwargs.get("raw", False):
         instance = kwargs["instance"]
 
+        # a partial save that does not touch epic or sprint can't move the story,
+        # so skip the lookups of its previous epic and sprint
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and not {"epic", "epic_id", "sprint", "sprint_id"} & update_fields:
+            return
+
         if instance.id is None:
             previous_epic = None
         else:
@@ -79,9 +79,10 @@ def epic_set_state(epic_ids, state_slug):
     except EpicState.DoesNotExist:
         return
 
-    Epic.objects.filter(id__in=epic_ids).update(state=state)
-
+    # save each epic so the state change gets recorded in its history
     for epic in Epic.objects.filter(id__in=epic_ids):
+        epic.state = state
+        epic.save()
         epic.update_state()
 
 
@@ -89,8 +90,9 @@ def epic_set_state(epic_ids, state_slug):
 def reset_epic(story_ids):
     # get affected sprint and epic ids before removing them: evaluate queryset
     # because they're lazy :)
-    epic_ids = list(Story.objects.filter(id__in=story_ids).values_list("epic_id", flat=True))
-    sprint_ids = list(Story.objects.filter(id__in=story_ids).values_list("sprint_id", flat=True))
+    parent_ids = list(Story.objects.filter(id__in=story_ids).values_list("epic_id", "sprint_id"))
+    epic_ids = [epic_id for epic_id, _ in parent_ids]
+    sprint_ids = [sprint_id for _, sprint_id in parent_ids]
 
     Story.objects.filter(id__in=story_ids).update(epic=None)
 
@@ -107,7 +109,7 @@ def reset_epic(story_ids):
 @app.task(ignore_result=True)
 def handle_story_change(story_id):
     try:
-        story = Story.objects.get(pk=story_id)
+        story = Story.objects.select_related("epic__state", "sprint").get(pk=story_id)
     except Story.DoesNotExist:
         return
 
@@ -1,14 +1,23 @@
-from django.test import TestCase
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.urls import reverse
 
+from matorral.sprints.models import Sprint
 from matorral.stories.factories import StoryFactory
+from matorral.stories.models import Epic, EpicState, StoryState
+from matorral.stories.tasks import epic_set_state
+from matorral.stories.templatetags.stories_tags import to_html
+from matorral.stories.views import StoryDetailView, StoryList
+from matorral.users.tests.factories import UserFactory
 from matorral.workspaces.factories import WorkspaceFactory
 
 
 class StoryViewsTest(TestCase):
-    def setUp(self):
-        self.workspace = WorkspaceFactory.create()
-        self.story = StoryFactory.create(workspace=self.workspace)
+    @classmethod
+    def setUpTestData(cls):
+        cls.workspace = WorkspaceFactory.create()
+        cls.story = StoryFactory.create(workspace=cls.workspace)
 
     def test_list(self):
         response = self.client.get(reverse("stories:story-list", args=[self.workspace.slug]))
@@ -17,3 +26,146 @@ class StoryViewsTest(TestCase):
     def test_detail(self):
         response = self.client.get(self.story.get_absolute_url())
         self.assertEqual(response.status_code, 302)
+
+
+class StoryListFiltersTest(SimpleTestCase):
+    def test_build_filters(self):
+        params = StoryList()._build_filters("login state:started label:ui:ux unknown:value")
+        self.assertEqual(
+            params, {"title__icontains": "login", "state__name__iexact": "started", "tags__name__iexact": "ui:ux"}
+        )
+
+
+class ToHtmlFilterTest(SimpleTestCase):
+    def test_links_and_line_breaks(self):
+        self.assertEqual(
+            to_html("see https://example.com\nthanks"),
+            'see <a target="_blank" href="https://example.com">https://example.com</a><br>thanks',
+        )
+
+
+class UpdatePointsAndProgressTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.workspace = WorkspaceFactory.create()
+        StoryState.objects.filter(slug="dn").update(stype=StoryState.STATE_DONE)
+        cls.done = StoryState.objects.get(slug="dn")
+        cls.planning = StoryState.objects.get(slug="pl")
+
+    def test_sums_points(self):
+        sprint = Sprint.objects.create(title="Sprint 1", workspace=self.workspace)
+        StoryFactory.create(workspace=self.workspace, sprint=sprint, state=self.done, points=3)
+        StoryFactory.create(workspace=self.workspace, sprint=sprint, state=self.planning, points=1)
+
+        sprint.update_points_and_progress()
+
+        self.assertEqual((sprint.total_points, sprint.points_done, sprint.story_count, sprint.progress), (4, 3, 2, 75))
+
+    def test_counts_stories_without_points(self):
+        sprint = Sprint.objects.create(title="Sprint 2", workspace=self.workspace)
+        StoryFactory.create(workspace=self.workspace, sprint=sprint, state=self.done, points=0)
+        StoryFactory.create(workspace=self.workspace, sprint=sprint, state=self.planning, points=0)
+        StoryFactory.create(workspace=self.workspace, sprint=sprint, state=self.planning, points=0)
+
+        sprint.update_points_and_progress()
+
+        self.assertEqual((sprint.total_points, sprint.points_done, sprint.story_count, sprint.progress), (3, 1, 3, 33))
+
+
+@override_settings(STATICFILES_STORAGE="django.contrib.staticfiles.storage.StaticFilesStorage")
+class StoryViewsLoggedInTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory.create()
+        cls.workspace = WorkspaceFactory.create(owner=cls.user)
+        cls.workspace.members.add(cls.user)
+        cls.story = StoryFactory.create(workspace=cls.workspace, requester=cls.user, assignee=cls.user)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_list(self):
+        response = self.client.get(reverse("stories:story-list", args=[self.workspace.slug]))
+        self.assertEqual(response.status_code, 200)
+
+    def test_detail(self):
+        response = self.client.get(self.story.get_absolute_url())
+        self.assertEqual(response.status_code, 200)
+
+    def test_story_add(self):
+        response = self.client.get(reverse("stories:story-add", args=[self.workspace.slug]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["form"].workspace, self.workspace)
+
+    def test_epic_add(self):
+        response = self.client.get(reverse("stories:epic-add", args=[self.workspace.slug]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["form"].workspace, self.workspace)
+
+    def test_detail_loads_related_objects(self):
+        epic = Epic.objects.create(title="Epic", workspace=self.workspace)
+        story = StoryFactory.create(workspace=self.workspace, epic=epic)
+
+        story = StoryDetailView.queryset.get(pk=story.pk)
+        with self.assertNumQueries(0):
+            story.epic.get_absolute_url()
+            str(story.requester), str(story.assignee), str(story.state)
+
+    def test_epic_detail(self):
+        epic = Epic.objects.create(title="Epic", workspace=self.workspace, state=EpicState.objects.first())
+        StoryFactory.create(workspace=self.workspace, epic=epic)
+
+        response = self.client.get(epic.get_absolute_url(), {"group_by": "state"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["objects_by_group"]), 1)
+
+
+class EpicUpdateStateTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.workspace = WorkspaceFactory.create()
+        EpicState.objects.filter(slug="ip").update(stype=EpicState.STATE_STARTED)
+        StoryState.objects.filter(slug="ip").update(stype=StoryState.STATE_STARTED)
+
+    def test_moves_to_started(self):
+        epic = Epic.objects.create(title="Epic", workspace=self.workspace, state=EpicState.objects.get(slug="pl"))
+        StoryFactory.create(workspace=self.workspace, epic=epic, state=StoryState.objects.get(slug="ip"))
+
+        epic.update_state()
+
+        epic.refresh_from_db()
+        self.assertEqual(epic.state_id, "ip")
+
+    def test_epic_set_state_records_history(self):
+        epic = Epic.objects.create(title="Epic", workspace=self.workspace, state=EpicState.objects.get(slug="pl"))
+        history_count = epic.history.count()
+
+        epic_set_state([epic.id], "dn")
+
+        epic.refresh_from_db()
+        self.assertEqual(epic.state_id, "dn")
+        self.assertEqual(epic.history.count(), history_count + 1)
+
+
+class StoryPreSaveTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.story = StoryFactory.create(workspace=WorkspaceFactory.create())
+
+    def save_story(self, **kwargs):
+        with mock.patch("matorral.stories.models.Epic.objects.get", return_value=None) as epic_get, mock.patch(
+            "matorral.sprints.models.Sprint.objects.get", return_value=None
+        ) as sprint_get:
+            self.story.save(**kwargs)
+
+        return epic_get.called, sprint_get.called
+
+    def test_full_save_looks_up_previous_epic_and_sprint(self):
+        self.assertEqual(self.save_story(), (True, True))
+
+    def test_partial_save_skips_previous_epic_and_sprint_lookups(self):
+        self.assertEqual(self.save_story(update_fields=["title"]), (False, False))
+
+    def test_partial_save_of_epic_looks_up_previous_epic_and_sprint(self):
+        self.assertEqual(self.save_story(update_fields=["epic"]), (True, True))
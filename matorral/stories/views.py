@@ -33,21 +33,22 @@ class EpicDetailView(DetailView):
     """ """
 
     model = Epic
+    queryset = Epic.objects.select_related("owner", "state")
 
-    def get_children(self):
-        queryset = self.get_object().story_set.select_related("requester", "assignee", "sprint", "state")
+    group_by_config = dict(
+        sprint=("sprint__starts_at", lambda story: story.sprint and story.sprint.title or "No sprint"),
+        state=("state__slug", lambda story: story.state.name),
+        requester=("requester__id", lambda story: story.requester and story.requester.username or "Unset"),
+        assignee=("assignee__id", lambda story: story.assignee and story.assignee.username or "Unassigned"),
+    )
 
-        config = dict(
-            sprint=("sprint__starts_at", lambda story: story.sprint and story.sprint.title or "No sprint"),
-            state=("state__slug", lambda story: story.state.name),
-            requester=("requester__id", lambda story: story.requester and story.requester.username or "Unset"),
-            assignee=("assignee__id", lambda story: story.assignee and story.assignee.username or "Unassigned"),
-        )
+    def get_children(self):
+        queryset = self.object.story_set.select_related("requester", "assignee", "sprint", "state")
 
         group_by = self.request.GET.get("group_by")
 
         try:
-            order_by, fx = config[group_by]
+            order_by, fx = self.group_by_config[group_by]
         except KeyError:
             return [(None, queryset)]
         else:
@@ -77,15 +78,11 @@ class EpicDetailView(DetailView):
             reset_epic.delay(story_ids)
 
         state = params.get("state")
-        if isinstance(state, list):
-            state = state[0]
         if state:
             story_ids = [t[6:] for t in params.keys() if "story-" in t]
             story_set_state.delay(story_ids, state)
 
         assignee = params.get("assignee")
-        if isinstance(assignee, list):
-            assignee = assignee[0]
         if assignee:
             story_ids = [t[6:] for t in params.keys() if "story-" in t]
             story_set_assignee.delay(story_ids, assignee)
@@ -131,6 +128,14 @@ class StoryBaseView:
 
         return context
 
+    def get_form_class(self):
+        return StoryForm
+
+    def get_form_kwargs(self):
+        kwargs = super().get_form_kwargs()
+        kwargs["workspace"] = self.request.workspace
+        return kwargs
+
 
 @method_decorator(login_required, name="dispatch")
 class StoryCreateView(StoryBaseView, CreateView):
@@ -157,14 +162,6 @@ class StoryCreateView(StoryBaseView, CreateView):
         form = self.get_form_class()(**kwargs)
         return self.form_valid(form)
 
-    def get_form_class(self):
-        return StoryForm
-
-    def get_form_kwargs(self):
-        kwargs = super().get_form_kwargs()
-        kwargs["workspace"] = self.request.workspace
-        return kwargs
-
 
 @method_decorator(login_required, name="dispatch")
 class StoryUpdateView(StoryBaseView, UpdateView):
@@ -179,14 +176,6 @@ class StoryUpdateView(StoryBaseView, UpdateView):
         form = self.get_form_class()(**kwargs)
         return self.form_valid(form)
 
-    def get_form_class(self):
-        return StoryForm
-
-    def get_form_kwargs(self):
-        kwargs = super().get_form_kwargs()
-        kwargs["workspace"] = self.request.workspace
-        return kwargs
-
 
 class EpicBaseView:
     model = Epic
@@ -210,13 +199,6 @@ class EpicBaseView:
         context["current_workspace"] = self.kwargs["workspace"]
         return context
 
-
-@method_decorator(login_required, name="dispatch")
-class EpicCreateView(EpicBaseView, CreateView):
-
-    def get_initial(self):
-        return dict(owner=self.request.user.id, state="pl")
-
     def get_form_class(self):
         return EpicForm
 
@@ -225,6 +207,13 @@ class EpicCreateView(EpicBaseView, CreateView):
         kwargs["workspace"] = self.request.workspace
         return kwargs
 
+
+@method_decorator(login_required, name="dispatch")
+class EpicCreateView(EpicBaseView, CreateView):
+
+    def get_initial(self):
+        return dict(owner=self.request.user.id, state="pl")
+
     def post(self, *args, **kwargs):
         kwargs = self.get_form_kwargs()
         kwargs["data"] = self.request.POST
@@ -245,14 +234,6 @@ class EpicUpdateView(EpicBaseView, UpdateView):
         form = self.get_form_class()(**kwargs)
         return self.form_valid(form)
 
-    def get_form_class(self):
-        return EpicForm
-
-    def get_form_kwargs(self):
-        kwargs = super().get_form_kwargs()
-        kwargs["workspace"] = self.request.workspace
-        return kwargs
-
 
 @method_decorator(login_required, name="dispatch")
 class EpicList(BaseListView):
@@ -279,14 +260,10 @@ class EpicList(BaseListView):
                 duplicate_epics.delay(epic_ids)
 
             state = params.get("state")
-            if isinstance(state, list):
-                state = state[0]
             if state:
                 epic_set_state.delay(epic_ids, state)
 
             owner = params.get("owner")
-            if isinstance(owner, list):
-                owner = owner[0]
             if owner:
                 epic_set_owner.delay(epic_ids, owner)
 
@@ -358,14 +335,10 @@ class StoryList(BaseListView):
                     story_set_epic.delay(story_ids, add_to_epic)
 
             state = params.get("state")
-            if isinstance(state, list):
-                state = state[0]
             if state:
                 story_set_state.delay(story_ids, state)
 
             assignee = params.get("assignee")
-            if isinstance(assignee, list):
-                assignee = assignee[0]
             if assignee:
                 story_set_assignee.delay(story_ids, assignee)
 
@@ -378,6 +351,8 @@ class StoryDetailView(DetailView):
     """ """
 
     model = Story
+    # the page links to the epic, whose get_absolute_url needs its workspace slug
+    queryset = Story.objects.select_related("epic__workspace", "requester", "assignee", "state")
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -22,11 +22,9 @@ class MyUserCreationForm(UserCreationForm):
 
     def clean_username(self):
         username = self.cleaned_data["username"]
-        try:
-            User.objects.get(username=username)
-        except User.DoesNotExist:
-            return username
-        raise forms.ValidationError(self.error_messages["duplicate_username"])
+        if User.objects.filter(username=username).exists():
+            raise forms.ValidationError(self.error_messages["duplicate_username"])
+        return username
 
 
 @admin.register(User)
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.14 on 2026-10-17 13:17
+
+import matorral.users.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0002_alter_user_first_name"),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name="user",
+            managers=[
+                ("objects", matorral.users.models.UserManager()),
+            ],
+        ),
+    ]
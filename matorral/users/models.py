@@ -1,15 +1,27 @@
-from django.contrib.auth.models import AbstractUser
+from django.contrib.auth.models import AbstractUser, UserManager as DjangoUserManager
 from django.db import models
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
 
+class UserQuerySet(models.QuerySet):
+    def for_choices(self):
+        # select widgets only render the username, so skip loading the rest of the row
+        return self.only("id", "username")
+
+
+class UserManager(DjangoUserManager.from_queryset(UserQuerySet)):
+    pass
+
+
 class User(AbstractUser):
 
     # First Name and Last Name do not cover name patterns
     # around the globe.
     name = models.CharField(_("Name of User"), blank=True, max_length=255)
 
+    objects = UserManager()
+
     def __str__(self):
         return self.username
 
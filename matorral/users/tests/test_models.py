@@ -1,15 +1,22 @@
 from django.test import TestCase
 
+from matorral.users.models import User
 from matorral.users.tests.factories import UserFactory
 
 
 class TestUser(TestCase):
 
-    def setUp(self):
-        self.user = UserFactory.create(username="testuser")
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory.create(username="testuser")
 
     def test__str__(self):
         self.assertEqual(self.user.__str__(), "testuser")  # This is the default username for self.make_user()
 
     def test_get_absolute_url(self):
         self.assertEqual(self.user.get_absolute_url(), "/users/testuser/")
+
+    def test_for_choices_defers_other_fields(self):
+        user = User.objects.for_choices().get(pk=self.user.pk)
+        self.assertEqual(str(user), "testuser")
+        self.assertIn("password", user.get_deferred_fields())
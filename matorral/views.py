@@ -5,6 +5,7 @@ class BaseListView(ListView):
     paginate_by = 16
 
     filter_fields = {}
+    search_lookup = "title__icontains"
     select_related = None
     prefetch_related = None
 
@@ -12,15 +13,15 @@ class BaseListView(ListView):
         params = {}
 
         for part in (q or "").split():
-            if ":" in part:
-                field, value = part.split(":")
+            field, separator, value = part.partition(":")
+            if separator:
                 try:
                     operator = self.filter_fields[field]
                     params[operator] = value
                 except KeyError:
                     continue
             else:
-                params["title__icontains"] = part
+                params[self.search_lookup] = part
 
         return params
 
@@ -36,12 +37,15 @@ class BaseListView(ListView):
 
         return context
 
+    def get_base_filters(self):
+        return dict(workspace__slug=self.kwargs["workspace"])
+
     def get_queryset(self):
         qs = self.model.objects
 
         q = self.request.GET.get("q")
 
-        params = dict(workspace__slug=self.kwargs["workspace"])
+        params = self.get_base_filters()
 
         if q is None:
             qs = qs.filter(**params)
@@ -27,12 +27,8 @@ class WorkspaceMiddleware:
         if not request.user.is_authenticated:
             return None
 
-        queryset = (
-            Workspace.objects.filter(owner=request.user) | Workspace.objects.filter(members=request.user)
-        ).distinct()
-
         try:
-            workspace = queryset.get(slug=workspace_slug)
+            workspace = Workspace.objects.for_user(request.user).get(slug=workspace_slug)
             request.workspace = workspace
         except Workspace.DoesNotExist:
             raise Http404
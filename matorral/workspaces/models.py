@@ -4,6 +4,16 @@ from django.conf import settings
 from django.db import models
 
 
+class WorkspaceQuerySet(models.QuerySet):
+    def for_user(self, user):
+        """
+        Workspaces the user owns or is a member of. Membership is checked with a subquery instead of joining the
+        members table, so each workspace is returned once without needing distinct().
+        """
+        memberships = self.model.members.through.objects.filter(user=user).values("workspace_id")
+        return self.filter(models.Q(owner=user) | models.Q(id__in=memberships))
+
+
 class Workspace(models.Model):
     """ """
 
@@ -18,6 +28,8 @@ class Workspace(models.Model):
     created_at = models.DateTimeField(auto_now=True, db_index=True)
     updated_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
+    objects = WorkspaceQuerySet.as_manager()
+
     class Meta:
         unique_together = ("slug", "owner")
         get_latest_by = "created_at"
@@ -1 +1,31 @@
-# Create your tests here.
+from django.test import TestCase
+
+from matorral.users.tests.factories import UserFactory
+from matorral.workspaces.factories import WorkspaceFactory
+from matorral.workspaces.models import Workspace
+
+
+class WorkspaceQuerySetTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # the first user gets a default workspace on signup, so create the other owner first
+        other_user = UserFactory.create()
+        cls.user = UserFactory.create()
+        cls.owned = WorkspaceFactory.create(owner=cls.user)
+        cls.owned.members.add(cls.user)
+        cls.joined = WorkspaceFactory.create(owner=other_user)
+        cls.joined.members.add(cls.user)
+        cls.other = WorkspaceFactory.create(owner=other_user)
+
+    def test_for_user(self):
+        self.assertCountEqual(Workspace.objects.for_user(self.user), [self.owned, self.joined])
+
+
+class CreateDefaultWorkspaceTest(TestCase):
+    def test_only_first_user_gets_default_workspace(self):
+        first_user = UserFactory.create()
+        UserFactory.create()
+
+        workspace = Workspace.objects.get()
+        self.assertEqual((workspace.slug, workspace.owner), ("default", first_user))
+        self.assertEqual(list(workspace.members.all()), [first_user])
@@ -5,11 +5,11 @@ from django.http import HttpResponseRedirect, JsonResponse
 from django.urls import reverse_lazy
 from django.utils.decorators import method_decorator
 from django.utils.text import slugify
-from django.views.generic import ListView
 from django.views.generic.detail import DetailView
 from django.views.generic.edit import CreateView, UpdateView
 
 from ..utils import get_clean_next_url
+from ..views import BaseListView
 from .models import Workspace
 from .tasks import duplicate_workspaces, remove_workspaces
 
@@ -20,7 +20,7 @@ class WorkspaceDetailView(DetailView):
     model = Workspace
 
     def get_children(self):
-        return self.get_object().members.order_by("username")
+        return self.object.members.order_by("username")
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -42,81 +42,27 @@ class WorkspaceDetailView(DetailView):
             return HttpResponseRedirect(url)
 
 
-class BaseListView(ListView):
-    paginate_by = 16
-
-    filter_fields = {}
-    select_related = None
-    prefetch_related = None
-
-    def _build_filters(self, q):
-        params = {}
-
-        for part in (q or "").split():
-            if ":" in part:
-                field, value = part.split(":")
-                try:
-                    operator = self.filter_fields[field]
-                    params[operator] = value
-                except KeyError:
-                    continue
-            else:
-                params["name__icontains"] = part
-
-        return params
-
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-
-        if self.request.GET.get("q") is not None:
-            context["show_all_url"] = self.request.path
-
-        context["title"] = self.model._meta.verbose_name_plural.capitalize()
-        context["singular_title"] = self.model._meta.verbose_name.capitalize()
-        context["current_workspace"] = self.kwargs["workspace"]
-
-        return context
-
-    def get_queryset(self):
-        qs = self.model.objects
-
-        q = self.request.GET.get("q")
-
-        params = self._build_filters(q)
-
-        if q is None:
-            qs = qs.all()
-        else:
-            qs = qs.filter(**params)
-
-        if self.select_related is not None:
-            qs = qs.select_related(*self.select_related)
-
-        if self.prefetch_related is not None:
-            qs = qs.prefetch_related(*self.prefetch_related)
-
-        return qs
-
-
 @method_decorator(login_required, name="dispatch")
 class WorkspaceList(BaseListView):
     model = Workspace
 
     filter_fields = dict(owner="owner__username")
+    search_lookup = "name__icontains"
 
     select_related = None
     prefetch_related = None
 
+    def get_base_filters(self):
+        # workspaces are not scoped to a workspace: list everything the user can see
+        return {}
+
     def get_queryset(self):
-        return (
-            super().get_queryset().filter(owner=self.request.user)
-            | super().get_queryset().filter(members=self.request.user)
-        ).distinct()
+        return super().get_queryset().for_user(self.request.user)
 
     def post(self, *args, **kwargs):
         params = dict(parse_qsl(self.request.body.decode("utf-8")))
 
-        workspace_ids = [t.split("workspace-")[1] for t in params.keys() if "workspace-" in t]
+        workspace_ids = [t[10:] for t in params.keys() if "workspace-" in t]
 
         if len(workspace_ids) > 0:
             if params.get("remove") == "yes":
@@ -191,5 +137,5 @@ class WorkspaceUpdateView(WorkspaceBaseView, UpdateView):
 
 @login_required
 def workspace_index(request):
-    default_workspace = request.user.workspace_set.order_by("id").first()
-    return HttpResponseRedirect(reverse_lazy("stories:story-list", args=[default_workspace.slug]))
+    default_workspace_slug = request.user.workspace_set.order_by("id").values_list("slug", flat=True).first()
+    return HttpResponseRedirect(reverse_lazy("stories:story-list", args=[default_workspace_slug]))